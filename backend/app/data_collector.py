@@ -1,9 +1,19 @@
-import math
-import random
 import time
 from datetime import datetime
-from typing import Dict, List
-
+from typing import List, Sequence
+
+import msgspec
+import numpy as np
+
+from app.kernels import (
+    JOINT_NAMES,
+    NUM_JOINTS,
+    build_gait_table,
+    gait_kernel,
+    imu_kernel,
+    motor_kernel,
+    random_kernel,
+)
 from app.models import (
     IMUData,
     JointData,
@@ -18,6 +28,33 @@ from app.models import (
     TelemetryData,
 )
 
+# Uniform [-1, 1] samples drawn per packet: the joint kernels take two per
+# joint, motor current takes one per joint and each IMU takes six.
+_KERNEL_NOISE_SAMPLES = 2 * NUM_JOINTS
+_IMU_NOISE_START = _KERNEL_NOISE_SAMPLES + NUM_JOINTS
+_NOISE_SAMPLES_PER_TICK = _IMU_NOISE_START + 6 * NUM_JOINTS
+
+# Packets' worth of noise drawn per RNG call; the pool is refilled when used up.
+# Kept small so a refill (~10 µs) fits well inside the tick budget.
+_NOISE_POOL_TICKS = 64
+
+# Motor statuses are tracked internally as int8 codes indexing this tuple
+_MOTOR_STATUSES = (
+    MotorStatus.OK,
+    MotorStatus.WARNING,
+    MotorStatus.ERROR,
+    MotorStatus.OFFLINE,
+)
+_MOTOR_STATUS_CODES = {status: code for code, status in enumerate(_MOTOR_STATUSES)}
+_STATUS_WARNING = _MOTOR_STATUS_CODES[MotorStatus.WARNING]
+_STATUS_ERROR = _MOTOR_STATUS_CODES[MotorStatus.ERROR]
+
+_JOINT_INDEX = {joint_name: i for i, joint_name in enumerate(JOINT_NAMES)}
+
+# JSON encoder/decoder for the telemetry stream, created once and reused
+_encoder = msgspec.json.Encoder()
+_decoder = msgspec.json.Decoder(TelemetryData)
+
 
 class DataCollector:
 
@@ -31,88 +68,69 @@ class DataCollector:
 
         # Internal state tracking
         self._sequence = 0
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
         self._last_update_time = self._start_time
 
-        # Motor status tracking
-        self._motor_statuses: Dict[str, MotorStatus] = {
-            "left_hip": MotorStatus.OK,
-            "left_knee": MotorStatus.OK,
-            "right_hip": MotorStatus.OK,
-            "right_knee": MotorStatus.OK,
-        }
+        # Motor status tracking (codes into _MOTOR_STATUSES), in kernel joint order
+        self._motor_statuses = np.zeros(NUM_JOINTS, dtype=np.int8)
 
         # System state
         self._emergency_stop = False
         self._error_messages: List[str] = []
 
-        # Motor temperature tracking 
-        self._motor_temperatures = {
-            "left_hip": 25.0,
-            "left_knee": 25.0,
-            "right_hip": 25.0,
-            "right_knee": 25.0,
-        }
+        # Motor temperature tracking, indexed in kernel joint order
+        self._motor_temperatures = np.full(NUM_JOINTS, 25.0)
 
         # Battery tracking
         self._battery_percentage = 100.0
 
-        # Random mode state (smooth random walk)
-        self._random_positions = {
-            "left_hip": 0.0,
-            "left_knee": 0.0,
-            "right_hip": 0.0,
-            "right_knee": 0.0,
-        }
-        self._random_velocities = {
-            "left_hip": 0.0,
-            "left_knee": 0.0,
-            "right_hip": 0.0,
-            "right_knee": 0.0,
-        }
-
-    def get_telemetry(self) -> TelemetryData:
-        # Enforce update rate by sleeping if called too quickly
-        current_time = time.time()
-        time_since_last_call = current_time - self._last_update_time
-        expected_interval = 1.0 / self.update_rate_hz
-        
-        if time_since_last_call < expected_interval:
-            sleep_duration = expected_interval - time_since_last_call
-            time.sleep(sleep_duration)
-            current_time = time.time()
-            time_since_last_call = current_time - self._last_update_time
-        
-        self._last_update_time = current_time
-
-        # Generate joint data based on mode
-        joints = self._generate_joints(time_since_last_call)
-
-        # Generate motor data (correlated with joint torque)
-        motors = self._generate_motors(joints)
-
-        # Generate sensor data (correlated with joint movement)
-        sensors = self._generate_sensors(joints)
-
-        # Generate power data
-        power = self._generate_power(current_time, motors)
+        # Noise source, drawn in pools of _NOISE_POOL_TICKS packets (see _draw_noise)
+        self._rng = np.random.default_rng()
+        self._refill_noise_pool()
+        self._kernel_noise = np.zeros(_KERNEL_NOISE_SAMPLES)
+        self._motor_noise = np.zeros(NUM_JOINTS)
+        self._imu_noise = np.zeros((NUM_JOINTS, 6))
+
+        # IMU readings buffer reused every tick; rows view it as
+        # [gyroscope, acceleration]
+        self._imu_readings = np.zeros((NUM_JOINTS, 6))
+        self._imu_rows = self._imu_readings.reshape(NUM_JOINTS, 2, 3)
+
+        # Reusable packet, overwritten in place on every tick. Per-joint structs
+        # are also kept in kernel joint order so generators can index them.
+        self._packet = self._new_packet()
+        self._joint_data = [getattr(self._packet.joints, name) for name in JOINT_NAMES]
+        self._motor_data = [getattr(self._packet.motors, name) for name in JOINT_NAMES]
+        self._imu_data = [getattr(self._packet.sensors, name) for name in JOINT_NAMES]
+
+        # One precomputed gait cycle, looked up by phase every packet
+        self._gait_table = build_gait_table()
+
+        # Random mode state (smooth random walk), indexed in kernel joint order
+        self._random_positions = np.zeros(NUM_JOINTS)
+        self._random_velocities = np.zeros(NUM_JOINTS)
+
+        # Compile the joint kernels up front so the first packet isn't delayed
+        gait_kernel(0.0, self._gait_table, self._kernel_noise)
+        random_kernel(
+            0.0, np.zeros(NUM_JOINTS), np.zeros(NUM_JOINTS), self._kernel_noise
+        )
+        motor_kernel(np.zeros(NUM_JOINTS), np.zeros(NUM_JOINTS), self._motor_noise)
+        imu_kernel(np.zeros(NUM_JOINTS), self._imu_noise, self._imu_readings)
 
-        # Generate system data
-        system = self._generate_system(current_time, motors)
+        # Generate and discard one packet so the remaining first-call costs
+        # (NumPy reductions, encoder setup) are paid here rather than on the
+        # first live tick, then restore the initial state
+        self.get_telemetry_bytes()
+        self.reset()
 
-        # Create telemetry packet
-        telemetry = TelemetryData(
-            timestamp=datetime.now(),
-            sequence=self._sequence,
-            joints=joints,
-            motors=motors,
-            sensors=sensors,
-            power=power,
-            system=system,
-        )
+    def get_telemetry(self) -> TelemetryData:
+        """Generate the next telemetry packet as an independent, validated struct."""
+        return _decoder.decode(self.get_telemetry_bytes())
 
-        self._sequence += 1
-        return telemetry
+    def get_telemetry_bytes(self) -> bytes:
+        """Generate the next telemetry packet serialized as JSON bytes."""
+        return _encoder.encode(self._generate_packet())
 
     def set_motor_status(self, joint: str, status: MotorStatus) -> None:
         """
@@ -122,9 +140,10 @@ class DataCollector:
             joint: Joint name ("left_hip", "left_knee", "right_hip", "right_knee")
             status: MotorStatus value
         """
-        if joint not in self._motor_statuses:
+        if joint not in _JOINT_INDEX:
             raise ValueError(f"Invalid joint '{joint}'")
-        self._motor_statuses[joint] = status
+        code = _MOTOR_STATUS_CODES[MotorStatus(status)]
+        self._motor_statuses[_JOINT_INDEX[joint]] = code
 
     def set_emergency_stop(self, active: bool) -> None:
    
@@ -142,222 +161,164 @@ class DataCollector:
     def reset(self) -> None:
 
         self._sequence = 0
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
         self._last_update_time = self._start_time
-        self._motor_statuses = {
-            "left_hip": MotorStatus.OK,
-            "left_knee": MotorStatus.OK,
-            "right_hip": MotorStatus.OK,
-            "right_knee": MotorStatus.OK,
-        }
+        self._motor_statuses = np.zeros(NUM_JOINTS, dtype=np.int8)
 
         self._emergency_stop = False
         self._error_messages.clear()
-        self._motor_temperatures = {
-            "left_hip": 25.0,
-            "left_knee": 25.0,
-            "right_hip": 25.0,
-            "right_knee": 25.0,
-        }
+        self._motor_temperatures = np.full(NUM_JOINTS, 25.0)
         self._battery_percentage = 100.0
-        self._random_positions = {
-            "left_hip": 0.0,
-            "left_knee": 0.0,
-            "right_hip": 0.0,
-            "right_knee": 0.0,
-        }
-        self._random_velocities = {
-            "left_hip": 0.0,
-            "left_knee": 0.0,
-            "right_hip": 0.0,
-            "right_knee": 0.0,
-        }
+        self._random_positions = np.zeros(NUM_JOINTS)
+        self._random_velocities = np.zeros(NUM_JOINTS)
 
                                             # Private methods for data generation
 
-    def _generate_joints(self, dt: float) -> JointsData:
-        """Generate joint data based on current mode."""
-        if self.mode == "gait":
-            return self._generate_gait_joints()
-        else:
-            return self._generate_random_joints(dt)
+    @staticmethod
+    def _new_packet() -> TelemetryData:
+        """Allocate the packet structs that are overwritten in place every tick."""
 
-    def _generate_gait_joints(self) -> JointsData:
-        """Generate realistic walking gait joint patterns."""
-        # Time since start 
-        elapsed_total = time.time() - self._start_time
-
-        # Gait frequency: ~1 Hz 
-        gait_freq = 1.0
-        phase = 2 * math.pi * gait_freq * elapsed_total
-
-        # Hip joints: primary oscillation
-        hip_amplitude = 0.5  # radians
-        left_hip_pos = hip_amplitude * math.sin(phase)
-        right_hip_pos = hip_amplitude * math.sin(phase + math.pi)  # 180° out of phase
-
-        # Knee joints: phase-offset from hips, slightly larger amplitude
-        knee_amplitude = 0.6
-        knee_phase_offset = math.pi / 4  # 45° offset
-        left_knee_pos = knee_amplitude * math.sin(phase + knee_phase_offset)
-        right_knee_pos = knee_amplitude * math.sin(phase + math.pi + knee_phase_offset)
-
-        # Velocities: derivative of position + small noise
-        vel_factor = hip_amplitude * 2 * math.pi * gait_freq
-        left_hip_vel = vel_factor * math.cos(phase) + self._noise(0.1)
-        right_hip_vel = vel_factor * math.cos(phase + math.pi) + self._noise(0.1)
-
-        vel_factor_knee = knee_amplitude * 2 * math.pi * gait_freq
-        left_knee_vel = vel_factor_knee * math.cos(phase + knee_phase_offset) + self._noise(0.1)
-        right_knee_vel = (
-            vel_factor_knee * math.cos(phase + math.pi + knee_phase_offset) + self._noise(0.1)
-        )
+        def joint() -> JointData:
+            return JointData(position=0.0, velocity=0.0, torque=0.0)
 
-        # Torques: correlated with velocity, clamped to range
-        left_hip_torque = self._clamp(left_hip_vel * 15.0 + self._noise(1.0), -30.0, 30.0)
-        right_hip_torque = self._clamp(right_hip_vel * 15.0 + self._noise(1.0), -30.0, 30.0)
-        left_knee_torque = self._clamp(left_knee_vel * 15.0 + self._noise(1.0), -30.0, 30.0)
-        right_knee_torque = self._clamp(right_knee_vel * 15.0 + self._noise(1.0), -30.0, 30.0)
-
-        return JointsData(
-            left_hip=JointData(
-                position=self._clamp(left_hip_pos, -math.pi, math.pi),
-                velocity=self._clamp(left_hip_vel, -2.0, 2.0),
-                torque=left_hip_torque,
-            ),
-            right_hip=JointData(
-                position=self._clamp(right_hip_pos, -math.pi, math.pi),
-                velocity=self._clamp(right_hip_vel, -2.0, 2.0),
-                torque=right_hip_torque,
-            ),
-            left_knee=JointData(
-                position=self._clamp(left_knee_pos, -math.pi, math.pi),
-                velocity=self._clamp(left_knee_vel, -2.0, 2.0),
-                torque=left_knee_torque,
-            ),
-            right_knee=JointData(
-                position=self._clamp(right_knee_pos, -math.pi, math.pi),
-                velocity=self._clamp(right_knee_vel, -2.0, 2.0),
-                torque=right_knee_torque,
-            ),
-        )
+        def motor() -> MotorData:
+            return MotorData(current=0.0, temperature=0.0, status=MotorStatus.OK)
 
-    def _generate_random_joints(self, dt: float) -> JointsData:
-        """Generate smooth random joint variations using random walk."""
-        joints_list = ["left_hip", "left_knee", "right_hip", "right_knee"]
-
-        for joint in joints_list:
-            # Random walk with smoothing
-            random_accel = self._noise(0.5)
-            self._random_velocities[joint] += random_accel * dt
-            self._random_velocities[joint] = self._clamp(self._random_velocities[joint], -2.0, 2.0)
-
-            # Update position
-            self._random_positions[joint] += self._random_velocities[joint] * dt
-            self._random_positions[joint] = self._clamp(
-                self._random_positions[joint], -math.pi, math.pi
-            )
-
-        # Generate torques correlated with velocities
-        left_hip_torque = self._clamp(self._random_velocities["left_hip"] * 15.0 + self._noise(1.0), -30.0, 30.0)
-        right_hip_torque = self._clamp(self._random_velocities["right_hip"] * 15.0 + self._noise(1.0), -30.0, 30.0)
-        left_knee_torque = self._clamp(self._random_velocities["left_knee"] * 15.0 + self._noise(1.0), -30.0, 30.0)
-        right_knee_torque = self._clamp(self._random_velocities["right_knee"] * 15.0 + self._noise(1.0), -30.0, 30.0)
-
-        return JointsData(
-            left_hip=JointData(
-                position=self._random_positions["left_hip"],
-                velocity=self._random_velocities["left_hip"],
-                torque=left_hip_torque,
+        def imu() -> IMUData:
+            return IMUData(acceleration=[0.0, 0.0, 0.0], gyroscope=[0.0, 0.0, 0.0])
+
+        return TelemetryData(
+            timestamp=datetime.now(),
+            sequence=0,
+            joints=JointsData(
+                left_hip=joint(),
+                left_knee=joint(),
+                right_hip=joint(),
+                right_knee=joint(),
             ),
-            right_hip=JointData(
-                position=self._random_positions["right_hip"],
-                velocity=self._random_velocities["right_hip"],
-                torque=right_hip_torque,
+            motors=MotorsData(
+                left_hip=motor(),
+                left_knee=motor(),
+                right_hip=motor(),
+                right_knee=motor(),
             ),
-            left_knee=JointData(
-                position=self._random_positions["left_knee"],
-                velocity=self._random_velocities["left_knee"],
-                torque=left_knee_torque,
+            sensors=SensorsData(
+                left_hip=imu(), left_knee=imu(), right_hip=imu(), right_knee=imu()
             ),
-            right_knee=JointData(
-                position=self._random_positions["right_knee"],
-                velocity=self._random_velocities["right_knee"],
-                torque=right_knee_torque,
+            power=PowerData(
+                battery_percentage=0.0, battery_voltage=0.0, current_draw=0.0
+            ),
+            system=SystemData(
+                health_status=SystemHealthStatus.HEALTHY,
+                emergency_stop=False,
+                uptime_seconds=0.0,
             ),
         )
 
-    def _generate_motors(self, joints: JointsData) -> MotorsData:
-        """Generate motor data correlated with joint torques."""
-        motor_joints = {
-            "left_hip": joints.left_hip,
-            "right_hip": joints.right_hip,
-            "left_knee": joints.left_knee,
-            "right_knee": joints.right_knee,
-        }
-
-        motors_dict = {}
-        for joint_name, joint_data in motor_joints.items():
-            # Current correlated with torque magnitude
-            current = self._clamp(
-                abs(joint_data.torque) * 0.3 + 2.0 + self._noise(0.5), 0.5, 15.0
-            )
-
-            # Temperature thermal model: slowly approaches target based on current draw
-            target_temp = 45.0 + abs(current) * 0.5  # Baseline 45°C + variation with load
-            temp_diff = target_temp - self._motor_temperatures[joint_name]
-            self._motor_temperatures[joint_name] += temp_diff * 0.05  # Slow thermal response
-
-            motors_dict[joint_name] = MotorData(
-                current=current,
-                temperature=self._clamp(self._motor_temperatures[joint_name], 25.0, 65.0),
-                status=self._motor_statuses[joint_name],
-            )
-
-        return MotorsData(
-            left_hip=motors_dict["left_hip"],
-            right_hip=motors_dict["right_hip"],
-            left_knee=motors_dict["left_knee"],
-            right_knee=motors_dict["right_knee"],
+    def _generate_packet(self) -> TelemetryData:
+        """
+        Fill the pooled telemetry packet for the next tick.
+
+        The returned struct is reused on every call, so it must be serialized
+        (or copied) before the next packet is generated.
+        """
+        # Pacing is left to the caller; dt is simply the time since the last packet.
+        # The clock is read once per packet and passed to every generator.
+        current_time = time.monotonic()
+        time_since_last_call = current_time - self._last_update_time
+        self._last_update_time = current_time
+
+        self._draw_noise()
+        telemetry = self._packet
+
+        # Generate joint data based on mode
+        state = self._generate_joints(
+            current_time, time_since_last_call, self._joint_data
         )
 
-    def _generate_sensors(self, joints: JointsData) -> SensorsData:
-        """Generate IMU sensor data correlated with joint movement."""
-        # Gyroscope correlated with joint velocities
-        # Acceleration includes gravity (~-9.8 m/s² on y-axis)
-        sensors_dict = {}
-
-        joint_vels = {
-            "left_hip": joints.left_hip.velocity,
-            "right_hip": joints.right_hip.velocity,
-            "left_knee": joints.left_knee.velocity,
-            "right_knee": joints.right_knee.velocity,
-        }
-
-        for joint_name, vel in joint_vels.items():
-            # Gyroscope: correlated with joint velocity
-            gyr_x = self._clamp(vel * 0.3 + self._noise(0.1), -1.0, 1.0)
-            gyr_y = self._clamp(vel * 0.2 + self._noise(0.1), -1.0, 1.0)
-            gyr_z = self._clamp(vel * 0.25 + self._noise(0.1), -1.0, 1.0)
-
-            # Acceleration: includes gravity on y-axis
-            acc_x = self._clamp(self._noise(0.5), -2.0, 2.0)
-            acc_y = self._clamp(-9.8 + self._noise(0.3), -11.0, -8.0)
-            acc_z = self._clamp(self._noise(0.5), -2.0, 2.0)
-
-            sensors_dict[joint_name] = IMUData(
-                acceleration=[acc_x, acc_y, acc_z],
-                gyroscope=[gyr_x, gyr_y, gyr_z],
-            )
-
-        return SensorsData(
-            left_hip=sensors_dict["left_hip"],
-            right_hip=sensors_dict["right_hip"],
-            left_knee=sensors_dict["left_knee"],
-            right_knee=sensors_dict["right_knee"],
+        # Generate motor data (correlated with joint torque)
+        self._generate_motors(state[2 * NUM_JOINTS:], self._motor_data)
+
+        # Generate sensor data (correlated with joint movement)
+        self._generate_sensors(state[NUM_JOINTS:2 * NUM_JOINTS], self._imu_data)
+
+        # Generate power data
+        self._generate_power(current_time, self._motor_data, telemetry.power)
+
+        # Generate system data
+        self._generate_system(current_time, telemetry.system)
+
+        telemetry.timestamp = datetime.now()
+        telemetry.sequence = self._sequence
+
+        self._sequence += 1
+        return telemetry
+
+    def _generate_joints(
+        self, current_time: float, dt: float, joints: Sequence[JointData]
+    ) -> np.ndarray:
+        """
+        Generate joint data based on current mode.
+
+        Returns the kernel [position x4, velocity x4, torque x4] array so the
+        correlated generators can work on it without going through the structs.
+        """
+        if self.mode == "gait":
+            state = self._generate_gait_joints(current_time)
+        else:
+            state = self._generate_random_joints(dt)
+        self._store_joint_state(state, joints)
+        return state
+
+    def _generate_gait_joints(self, current_time: float) -> np.ndarray:
+        """Generate realistic walking gait joint patterns."""
+        # Time since start 
+        elapsed_total = current_time - self._start_time
+
+        return gait_kernel(elapsed_total, self._gait_table, self._kernel_noise)
+
+    def _generate_random_joints(self, dt: float) -> np.ndarray:
+        """Generate smooth random joint variations using random walk."""
+        return random_kernel(
+            dt, self._random_positions, self._random_velocities, self._kernel_noise
         )
 
-    def _generate_power(self, current_time: float, motors: MotorsData) -> PowerData:
+    @staticmethod
+    def _store_joint_state(state: np.ndarray, joints: Sequence[JointData]) -> None:
+        """Copy a kernel [position, velocity, torque] x4 array into joint structs."""
+        values = state.tolist()
+        for i, joint_data in enumerate(joints):
+            joint_data.position = values[i]
+            joint_data.velocity = values[NUM_JOINTS + i]
+            joint_data.torque = values[2 * NUM_JOINTS + i]
+
+    def _generate_motors(
+        self, torques: np.ndarray, motors: Sequence[MotorData]
+    ) -> None:
+        """Generate motor data correlated with joint torques."""
+        values = motor_kernel(
+            torques, self._motor_temperatures, self._motor_noise
+        ).tolist()
+        status_codes = self._motor_statuses.tolist()
+
+        for i, motor_data in enumerate(motors):
+            motor_data.current = values[i]
+            motor_data.temperature = values[NUM_JOINTS + i]
+            motor_data.status = _MOTOR_STATUSES[status_codes[i]]
+
+    def _generate_sensors(
+        self, velocities: np.ndarray, sensors: Sequence[IMUData]
+    ) -> None:
+        """Generate IMU sensor data correlated with joint movement."""
+        imu_kernel(velocities, self._imu_noise, self._imu_readings)
+        rows = self._imu_rows.tolist()
+        for imu_data, (gyroscope, acceleration) in zip(sensors, rows):
+            imu_data.gyroscope = gyroscope
+            imu_data.acceleration = acceleration
+
+    def _generate_power(
+        self, current_time: float, motors: Sequence[MotorData], power: PowerData
+    ) -> None:
         """Generate power system data."""
         # Battery depletes over time (~0.01%/sec), wraps to 100 at 20%
         elapsed = current_time - self._start_time
@@ -372,58 +333,48 @@ class DataCollector:
 
         # Current draw is sum of motor currents plus baseline
         baseline_current = 5.0
-        total_motor_current = (
-            motors.left_hip.current +
-            motors.right_hip.current +
-            motors.left_knee.current +
-            motors.right_knee.current
-        )
-        current_draw = self._clamp(baseline_current + total_motor_current, 5.0, 35.0)
+        total_motor_current = sum(motor.current for motor in motors)
+        current_draw = min(35.0, max(5.0, baseline_current + total_motor_current))
 
-        return PowerData(
-            battery_percentage=self._battery_percentage,
-            battery_voltage=battery_voltage,
-            current_draw=current_draw,
-        )
+        power.battery_percentage = self._battery_percentage
+        power.battery_voltage = battery_voltage
+        power.current_draw = current_draw
 
-    def _generate_system(self, current_time: float, motors: MotorsData) -> SystemData:
+    def _generate_system(self, current_time: float, system: SystemData) -> None:
         """Generate system health and status data."""
         # Determine health status
         health_status = SystemHealthStatus.HEALTHY
 
         if self._emergency_stop:
             health_status = SystemHealthStatus.CRITICAL
-        else:
-            # Check motor statuses
-            motor_statuses = [
-                motors.left_hip.status,
-                motors.right_hip.status,
-                motors.left_knee.status,
-                motors.right_knee.status,
-            ]
-
-            if any(status == MotorStatus.ERROR for status in motor_statuses):
-                health_status = SystemHealthStatus.CRITICAL
-            elif any(status == MotorStatus.WARNING for status in motor_statuses):
-                health_status = SystemHealthStatus.DEGRADED
+        # Check motor statuses
+        elif (self._motor_statuses == _STATUS_ERROR).any():
+            health_status = SystemHealthStatus.CRITICAL
+        elif (self._motor_statuses == _STATUS_WARNING).any():
+            health_status = SystemHealthStatus.DEGRADED
 
         uptime = current_time - self._start_time
 
-        return SystemData(
-            health_status=health_status,
-            emergency_stop=self._emergency_stop,
-            error_messages=self._error_messages.copy(),
-            uptime_seconds=uptime,
-        )
-
+        system.health_status = health_status
+        system.emergency_stop = self._emergency_stop
+        # No copy needed: the packet is serialized before anything can change the list
+        system.error_messages = self._error_messages
+        system.uptime_seconds = uptime
 
-
-    @staticmethod
-    def _noise(amplitude: float) -> float:
-        """Generate small random noise with given amplitude."""
-        return random.uniform(-amplitude, amplitude)
-
-    @staticmethod
-    def _clamp(value: float, min_val: float, max_val: float) -> float:
-        """Clamp a value between min and max."""
-        return max(min_val, min(max_val, value))
+    def _refill_noise_pool(self) -> None:
+        """Draw a fresh pool of noise samples and rewind to its first row."""
+        self._noise_pool = self._rng.uniform(
+            -1.0, 1.0, (_NOISE_POOL_TICKS, _NOISE_SAMPLES_PER_TICK)
+        )
+        self._noise_row = 0
+
+    def _draw_noise(self) -> None:
+        """Take the next packet's noise samples, refilling the pool when empty."""
+        if self._noise_row >= _NOISE_POOL_TICKS:
+            self._refill_noise_pool()
+
+        samples = self._noise_pool[self._noise_row]
+        self._noise_row += 1
+        self._kernel_noise = samples[:_KERNEL_NOISE_SAMPLES]
+        self._motor_noise = samples[_KERNEL_NOISE_SAMPLES:_IMU_NOISE_START]
+        self._imu_noise = samples[_IMU_NOISE_START:].reshape(NUM_JOINTS, 6)
@@ -0,0 +1,162 @@
+import math
+
+import numpy as np
+from numba import njit
+
+# ---------------------------------------------------------------------------
+# Joint layout shared by every kernel
+#
+# Joint kernels return a flat float64 array of length 12 laid out as
+# [position x4, velocity x4, torque x4].
+# ---------------------------------------------------------------------------
+JOINT_NAMES = ("left_hip", "right_hip", "left_knee", "right_knee")
+NUM_JOINTS = len(JOINT_NAMES)
+
+# Gait frequency: ~1 Hz
+GAIT_FREQ = 1.0
+
+# Samples per gait cycle in the precomputed gait table (see build_gait_table)
+GAIT_TABLE_SIZE = 1024
+
+# Right side is 180° out of phase, knees lead the hips by 45°.
+_PHASE_OFFSETS = np.array([0.0, math.pi, math.pi / 4, math.pi + math.pi / 4])
+
+# Hip amplitude 0.5 rad, knee amplitude slightly larger at 0.6 rad
+_GAIT_AMPLITUDES = np.array([0.5, 0.5, 0.6, 0.6])
+
+# Gyroscope sensitivity to joint velocity on each axis [x, y, z]
+_GYRO_SCALES = np.array([0.3, 0.2, 0.25])
+
+# Accelerometer baseline is gravity (~-9.8 m/s² on y-axis) plus per-axis
+# noise, clamped to the sensor range
+_GRAVITY = np.array([0.0, -9.8, 0.0])
+_ACC_NOISE = np.array([0.5, 0.3, 0.5])
+_ACC_LO = np.array([-2.0, -11.0, -2.0])
+_ACC_HI = np.array([2.0, -8.0, 2.0])
+
+
+@njit(cache=True, fastmath=True)
+def _clamp(value, min_val, max_val):
+    return max(min_val, min(max_val, value))
+
+
+def build_gait_table(size: int = GAIT_TABLE_SIZE) -> np.ndarray:
+    """
+    Precompute one gait cycle sampled at ``size`` evenly spaced phases.
+
+    The gait is periodic, so a single cycle covers the whole session. Rows are
+    laid out as [position x4, noise-free velocity x4].
+    """
+    omega = 2 * math.pi * GAIT_FREQ
+    phases = 2 * math.pi * np.arange(size) / size
+    angles = phases[:, None] + _PHASE_OFFSETS
+    positions = _GAIT_AMPLITUDES * np.sin(angles)
+    # Velocity: derivative of position
+    velocities = _GAIT_AMPLITUDES * omega * np.cos(angles)
+    return np.hstack((positions, velocities))
+
+
+@njit(cache=True, fastmath=True)
+def gait_kernel(t, gait_table, noise_buf):
+    """
+    Compute walking gait joint state at ``t`` seconds since start.
+
+    ``gait_table`` comes from build_gait_table; the row for the current phase
+    is looked up instead of evaluating sin/cos. ``noise_buf`` holds 8 uniform
+    samples in [-1, 1]: velocity noise for each joint followed by torque noise
+    for each joint.
+    """
+    out = np.empty(3 * NUM_JOINTS)
+    size = gait_table.shape[0]
+    row = gait_table[int(t * GAIT_FREQ * size) % size]
+
+    for i in range(NUM_JOINTS):
+        # Velocity: derivative of position + small noise
+        vel = row[NUM_JOINTS + i] + noise_buf[i] * 0.1
+
+        out[i] = _clamp(row[i], -math.pi, math.pi)
+        out[NUM_JOINTS + i] = _clamp(vel, -2.0, 2.0)
+        # Torque: correlated with velocity, clamped to range
+        out[2 * NUM_JOINTS + i] = _clamp(
+            vel * 15.0 + noise_buf[NUM_JOINTS + i], -30.0, 30.0
+        )
+
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def random_kernel(dt, pos, vel, noise_buf):
+    """
+    Advance the smooth random walk by ``dt`` seconds.
+
+    ``pos`` and ``vel`` are updated in place. ``noise_buf`` holds 8 uniform
+    samples in [-1, 1]: acceleration noise for each joint followed by torque
+    noise for each joint.
+    """
+    out = np.empty(3 * NUM_JOINTS)
+
+    for i in range(NUM_JOINTS):
+        # Random walk with smoothing
+        vel[i] = _clamp(vel[i] + noise_buf[i] * 0.5 * dt, -2.0, 2.0)
+        pos[i] = _clamp(pos[i] + vel[i] * dt, -math.pi, math.pi)
+
+        out[i] = pos[i]
+        out[NUM_JOINTS + i] = vel[i]
+        # Torque: correlated with velocity, clamped to range
+        out[2 * NUM_JOINTS + i] = _clamp(
+            vel[i] * 15.0 + noise_buf[NUM_JOINTS + i], -30.0, 30.0
+        )
+
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def imu_kernel(velocities, noise_buf, out):
+    """
+    Compute IMU readings correlated with the joint velocities.
+
+    ``noise_buf`` is a (4, 6) array of uniform samples in [-1, 1]: gyroscope
+    noise [x, y, z] followed by acceleration noise [x, y, z] for each joint.
+    Readings are written into the preallocated (4, 6) ``out`` array, one row
+    per joint laid out as [gyroscope x3, acceleration x3].
+    """
+    for i in range(NUM_JOINTS):
+        vel = velocities[i]
+
+        for k in range(3):
+            # Gyroscope: correlated with joint velocity
+            out[i, k] = _clamp(vel * _GYRO_SCALES[k] + noise_buf[i, k] * 0.1, -1.0, 1.0)
+
+            # Acceleration: includes gravity on y-axis
+            out[i, 3 + k] = _clamp(
+                _GRAVITY[k] + noise_buf[i, 3 + k] * _ACC_NOISE[k],
+                _ACC_LO[k],
+                _ACC_HI[k],
+            )
+
+
+@njit(cache=True, fastmath=True)
+def motor_kernel(torques, temperatures, noise_buf):
+    """
+    Compute motor currents from joint torques and advance the thermal model.
+
+    ``temperatures`` is updated in place. ``noise_buf`` holds one uniform
+    sample in [-1, 1] per joint for current noise. Returns a flat array laid
+    out as [current x4, temperature x4], with temperatures clamped to the
+    reported range.
+    """
+    out = np.empty(2 * NUM_JOINTS)
+
+    for i in range(NUM_JOINTS):
+        # Current correlated with torque magnitude
+        current = _clamp(abs(torques[i]) * 0.3 + 2.0 + noise_buf[i] * 0.5, 0.5, 15.0)
+
+        # Temperature thermal model: slowly approaches target based on current draw
+        target_temp = 45.0 + current * 0.5  # Baseline 45°C + variation with load
+        # Slow thermal response
+        temperatures[i] += (target_temp - temperatures[i]) * 0.05
+
+        out[i] = current
+        out[NUM_JOINTS + i] = _clamp(temperatures[i], 25.0, 65.0)
+
+    return out
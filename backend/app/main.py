@@ -1,9 +1,12 @@
+import asyncio
+import contextlib
 import logging
+import sys
 
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.websocket import websocket_endpoint
+from app.websocket import telemetry_producer, websocket_endpoint
 
 # ---------------------------------------------------------------------------
 # Logging
@@ -13,10 +16,27 @@ logging.basicConfig(
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
 )
 
+
+# ---------------------------------------------------------------------------
+# Lifespan
+# ---------------------------------------------------------------------------
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the telemetry producer for as long as the application is up."""
+    producer = asyncio.create_task(telemetry_producer())
+    try:
+        yield
+    finally:
+        producer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await producer
+
+
 app = FastAPI(
     title="Exoskeleton Telemetry API",
     description="WebSocket server for streaming exoskeleton telemetry data",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS for frontend development
@@ -45,3 +65,20 @@ async def health_check():
 async def ws(websocket: WebSocket):
     """WebSocket endpoint for streaming telemetry data."""
     await websocket_endpoint(websocket)
+
+
+# ---------------------------------------------------------------------------
+# Entrypoint (python -m app.main)
+# ---------------------------------------------------------------------------
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop is not available on Windows; fall back to the default asyncio loop
+    uvicorn.run(
+        "app.main:app",
+        host="127.0.0.1",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        ws="websockets",
+    )
@@ -1,8 +1,8 @@
 from datetime import datetime
 from enum import Enum
-from typing import List
+from typing import Annotated, List
 
-from pydantic import BaseModel, Field
+import msgspec
 
 
 class MotorStatus(str, Enum):
@@ -22,15 +22,17 @@ class SystemHealthStatus(str, Enum):
     CRITICAL = "critical"
 
 
-class JointData(BaseModel):
+class JointData(msgspec.Struct, kw_only=True):
     """Telemetry data for a single joint."""
 
-    position: float = Field(..., description="Joint angle in radians (-π to π)")
-    velocity: float = Field(..., description="Angular velocity in rad/s")
-    torque: float = Field(..., description="Applied torque in Nm")
+    position: Annotated[
+        float, msgspec.Meta(description="Joint angle in radians (-π to π)")
+    ]
+    velocity: Annotated[float, msgspec.Meta(description="Angular velocity in rad/s")]
+    torque: Annotated[float, msgspec.Meta(description="Applied torque in Nm")]
 
 
-class JointsData(BaseModel):
+class JointsData(msgspec.Struct, kw_only=True):
     """Telemetry data for all joints."""
 
     left_hip: JointData
@@ -39,15 +41,17 @@ class JointsData(BaseModel):
     right_knee: JointData
 
 
-class MotorData(BaseModel):
+class MotorData(msgspec.Struct, kw_only=True):
     """Telemetry data for a single motor."""
 
-    current: float = Field(..., description="Current draw in Amperes")
-    temperature: float = Field(..., description="Motor temperature in Celsius")
-    status: MotorStatus = Field(..., description="Motor health status")
+    current: Annotated[float, msgspec.Meta(description="Current draw in Amperes")]
+    temperature: Annotated[
+        float, msgspec.Meta(description="Motor temperature in Celsius")
+    ]
+    status: Annotated[MotorStatus, msgspec.Meta(description="Motor health status")]
 
 
-class MotorsData(BaseModel):
+class MotorsData(msgspec.Struct, kw_only=True):
     """Telemetry data for all motors."""
 
     left_hip: MotorData
@@ -56,18 +60,26 @@ class MotorsData(BaseModel):
     right_knee: MotorData
 
 
-class IMUData(BaseModel):
+class IMUData(msgspec.Struct, kw_only=True):
     """Telemetry data for a single IMU sensor."""
 
-    acceleration: List[float] = Field(
-        ..., min_length=3, max_length=3, description="Acceleration [x, y, z] in m/s²"
-    )
-    gyroscope: List[float] = Field(
-        ..., min_length=3, max_length=3, description="Angular velocity [x, y, z] in rad/s"
-    )
-
-
-class SensorsData(BaseModel):
+    acceleration: Annotated[
+        List[float],
+        msgspec.Meta(
+            min_length=3, max_length=3, description="Acceleration [x, y, z] in m/s²"
+        ),
+    ]
+    gyroscope: Annotated[
+        List[float],
+        msgspec.Meta(
+            min_length=3,
+            max_length=3,
+            description="Angular velocity [x, y, z] in rad/s",
+        ),
+    ]
+
+
+class SensorsData(msgspec.Struct, kw_only=True):
     """Telemetry data for all IMU sensors."""
 
     left_hip: IMUData
@@ -76,37 +88,44 @@ class SensorsData(BaseModel):
     right_knee: IMUData
 
 
-class PowerData(BaseModel):
+class PowerData(msgspec.Struct, kw_only=True):
     """Power system telemetry data."""
 
-    battery_percentage: float = Field(
-        ..., ge=0, le=100, description="Battery charge level (0-100%)"
-    )
-    battery_voltage: float = Field(..., description="Battery voltage in Volts")
-    current_draw: float = Field(..., description="Total current draw in Amperes")
+    battery_percentage: Annotated[
+        float, msgspec.Meta(ge=0, le=100, description="Battery charge level (0-100%)")
+    ]
+    battery_voltage: Annotated[
+        float, msgspec.Meta(description="Battery voltage in Volts")
+    ]
+    current_draw: Annotated[
+        float, msgspec.Meta(description="Total current draw in Amperes")
+    ]
 
 
-class SystemData(BaseModel):
+class SystemData(msgspec.Struct, kw_only=True):
     """System health and status data."""
 
-    health_status: SystemHealthStatus = Field(..., description="Overall system health")
-    emergency_stop: bool = Field(..., description="Emergency stop activated")
-    error_messages: List[str] = Field(
-        default_factory=list, description="Active error messages"
-    )
-    uptime_seconds: float = Field(..., description="System uptime in seconds")
-
-
-class TelemetryData(BaseModel):
+    health_status: Annotated[
+        SystemHealthStatus, msgspec.Meta(description="Overall system health")
+    ]
+    emergency_stop: Annotated[
+        bool, msgspec.Meta(description="Emergency stop activated")
+    ]
+    error_messages: Annotated[
+        List[str], msgspec.Meta(description="Active error messages")
+    ] = msgspec.field(default_factory=list)
+    uptime_seconds: Annotated[
+        float, msgspec.Meta(description="System uptime in seconds")
+    ]
+
+
+class TelemetryData(msgspec.Struct, kw_only=True):
     """Complete telemetry data packet sent over WebSocket."""
 
-    timestamp: datetime = Field(..., description="ISO 8601 timestamp")
-    sequence: int = Field(..., description="Packet sequence number")
+    timestamp: Annotated[datetime, msgspec.Meta(description="ISO 8601 timestamp")]
+    sequence: Annotated[int, msgspec.Meta(description="Packet sequence number")]
     joints: JointsData
     motors: MotorsData
     sensors: SensorsData
     power: PowerData
     system: SystemData
-
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
@@ -2,7 +2,7 @@ import asyncio
 import json
 import logging
 import os
-from typing import List
+from typing import Set
 
 from fastapi import WebSocket, WebSocketDisconnect
 
@@ -15,6 +15,8 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 UPDATE_RATE_HZ: float = float(os.getenv("UPDATE_RATE_HZ", "10.0"))
 DATA_MODE: str = os.getenv("DATA_MODE", "gait")
+# How long one client may take to accept a packet before it is disconnected
+SEND_TIMEOUT_S: float = float(os.getenv("SEND_TIMEOUT_S", "1.0"))
 
 
 # ---------------------------------------------------------------------------
@@ -24,26 +26,61 @@ class ConnectionManager:
     """Manages active WebSocket connections and broadcasts data to all clients."""
 
     def __init__(self) -> None:
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
+        # Close tasks for dropped clients, referenced until they finish
+        self._closing: Set[asyncio.Task] = set()
 
     async def connect(self, websocket: WebSocket) -> None:
         """Accept and store a new WebSocket connection."""
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
 
     def disconnect(self, websocket: WebSocket) -> None:
-        """Remove a connection from the active list."""
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-
-    async def broadcast(self, message: str) -> None:
-        """Send a message to every connected client."""
-        for connection in list(self.active_connections):
-            try:
-                await connection.send_text(message)
-            except Exception:
-                # If sending fails the client is probably gone – remove it
-                self.disconnect(connection)
+        """Remove a connection from the active set."""
+        self.active_connections.discard(websocket)
+
+    async def broadcast(self, message: bytes, timeout: float) -> None:
+        """
+        Send a message to every connected client concurrently.
+
+        Each send is bounded by ``timeout`` seconds, so a stalled client can
+        hold up a broadcast for at most that long. Clients whose send fails or
+        times out are dropped and closed in the background, so they see a
+        real close and can reconnect.
+        """
+        # Snapshot so results line up with connections even if the set changes
+        # while the sends are in flight
+        connections = tuple(self.active_connections)
+        results = await asyncio.gather(
+            *(
+                asyncio.wait_for(connection.send_bytes(message), timeout=timeout)
+                for connection in connections
+            ),
+            return_exceptions=True,
+        )
+
+        # If sending fails or times out the client is gone or stalled – remove it
+        dead = [
+            connection
+            for connection, result in zip(connections, results)
+            if isinstance(result, Exception)
+        ]
+        if dead:
+            logger.warning("Dropping %d unresponsive client(s)", len(dead))
+            self.active_connections.difference_update(dead)
+            for connection in dead:
+                task = asyncio.create_task(self._close(connection, timeout))
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close(websocket: WebSocket, timeout: float) -> None:
+        """Close a dropped connection, giving up after ``timeout`` seconds."""
+        try:
+            # 1013 (Try Again Later): the server gave up, not the client
+            await asyncio.wait_for(websocket.close(code=1013), timeout=timeout)
+        except Exception:
+            pass  # the connection is already closed or broken
 
     def get_connection_count(self) -> int:
         """Return the number of active connections."""
@@ -55,6 +92,51 @@ manager = ConnectionManager()
 collector = DataCollector(mode=DATA_MODE, update_rate_hz=UPDATE_RATE_HZ)
 
 
+# ---------------------------------------------------------------------------
+# Telemetry producer – one packet per tick, shared by every client
+# ---------------------------------------------------------------------------
+# Packet generation runs inline on the event loop, so it has to stay well
+# below the tick interval; slower ticks are logged.
+TICK_BUDGET_S: float = 0.0005
+
+
+async def telemetry_producer() -> None:
+    """
+    Generate telemetry at the configured rate and broadcast it to all clients.
+
+    Runs for the lifetime of the application (started from the FastAPI
+    lifespan), so the cost of generating and encoding a packet is paid once
+    per tick regardless of how many clients are connected.
+    """
+    interval = 1.0 / UPDATE_RATE_HZ
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(interval)
+
+        # Nobody is listening – skip generation entirely
+        if manager.get_connection_count() == 0:
+            continue
+
+        # Generation is a short CPU-only step, so it is called directly rather
+        # than handed to a thread; pacing comes from the asyncio.sleep above.
+        started = loop.time()
+        try:
+            payload = collector.get_telemetry_bytes()
+        except Exception as exc:
+            logger.error("Telemetry generation error: %s", exc)
+            continue
+
+        elapsed = loop.time() - started
+        if elapsed > TICK_BUDGET_S:
+            logger.warning(
+                "Telemetry generation took %.0f µs (budget %.0f µs)",
+                elapsed * 1e6,
+                TICK_BUDGET_S * 1e6,
+            )
+
+        await manager.broadcast(payload, timeout=SEND_TIMEOUT_S)
+
+
 # ---------------------------------------------------------------------------
 # WebSocket endpoint handler
 # ---------------------------------------------------------------------------
@@ -62,8 +144,8 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
     """
     /ws endpoint handler.
 
-    Accepts a WebSocket connection, streams telemetry JSON at the configured
-    rate, and gracefully handles disconnections.
+    Accepts a WebSocket connection and registers it for the telemetry
+    broadcast, then waits until the client disconnects.
     """
     client_id = f"{websocket.client.host}:{websocket.client.port}" if websocket.client else "unknown"
 
@@ -80,27 +162,13 @@ async def websocket_endpoint(websocket: WebSocket) -> None:
         manager.get_connection_count(),
     )
 
-    # --- streaming loop ------------------------------------------------------
-    interval = 1.0 / UPDATE_RATE_HZ
-    loop = asyncio.get_event_loop()
+    # --- wait for disconnect -------------------------------------------------
+    # Telemetry is pushed by telemetry_producer(); incoming frames are ignored.
     try:
         while True:
-            # Generate telemetry in a thread so the blocking sleep inside
-            # DataCollector.get_telemetry() doesn't freeze the event loop.
-            telemetry = await loop.run_in_executor(None, collector.get_telemetry)
-
-            # Serialize to JSON
-            try:
-                payload = telemetry.model_dump_json()
-            except Exception as ser_err:
-                logger.error("Serialization error: %s", ser_err)
-                continue
-
-            # Send to this specific client
-            await websocket.send_text(payload)
-
-            # Yield control and wait for next tick
-            await asyncio.sleep(interval)
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
 
     except WebSocketDisconnect:
         pass  # client closed the connection normally
@@ -0,0 +1,69 @@
+import asyncio
+
+from app.websocket import ConnectionManager
+
+
+class FakeWebSocket:
+    """Stand-in for a WebSocket that records frames and close codes."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False) -> None:
+        self.delay = delay
+        self.fail = fail
+        self.received = []
+        self.close_code = None
+
+    async def send_bytes(self, data: bytes) -> None:
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("connection closed")
+        self.received.append(data)
+
+    async def close(self, code: int = 1000) -> None:
+        self.close_code = code
+
+
+async def wait_for_closes(manager: ConnectionManager) -> None:
+    """Let the background close tasks started by broadcast() finish."""
+    await asyncio.gather(*manager._closing)
+
+
+async def test_stalled_client_does_not_block_fast_client():
+    manager = ConnectionManager()
+    fast = FakeWebSocket()
+    stalled = FakeWebSocket(delay=60.0)
+    manager.active_connections.update((fast, stalled))
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    packets = [b"packet-%d" % i for i in range(5)]
+    for packet in packets:
+        await manager.broadcast(packet, timeout=0.05)
+    elapsed = loop.time() - started
+
+    assert fast.received == packets
+    assert stalled.received == []
+    assert manager.active_connections == {fast}
+    # Only the first broadcast waits out the timeout; the rest go to the fast
+    # client alone
+    assert elapsed < 1.0
+
+    await wait_for_closes(manager)
+    assert stalled.close_code == 1013
+    assert fast.close_code is None
+
+
+async def test_failed_send_drops_connection():
+    manager = ConnectionManager()
+    healthy = FakeWebSocket()
+    broken = FakeWebSocket(fail=True)
+    manager.active_connections.update((healthy, broken))
+
+    await manager.broadcast(b"packet", timeout=0.05)
+
+    assert healthy.received == [b"packet"]
+    assert manager.get_connection_count() == 1
+    assert healthy in manager.active_connections
+
+    await wait_for_closes(manager)
+    assert broken.close_code == 1013
+    assert healthy.close_code is None
@@ -22,7 +22,10 @@ export const useWebSocket = (url: string): UseWebSocketResult => {
         setError(null);
 
         const ws = new WebSocket(url);
+        // Telemetry arrives as UTF-8 JSON in binary frames
+        ws.binaryType = 'arraybuffer';
         wsRef.current = ws;
+        const decoder = new TextDecoder();
 
         ws.onopen = () => {
             setConnectionState('connected');
@@ -31,7 +34,8 @@ export const useWebSocket = (url: string): UseWebSocketResult => {
 
         ws.onmessage = (event) => {
             try {
-                const data: TelemetryData = JSON.parse(event.data);
+                const text = typeof event.data === 'string' ? event.data : decoder.decode(event.data);
+                const data: TelemetryData = JSON.parse(text);
                 setTelemetry(data);
             } catch (err) {
                 console.error('Failed to parse telemetry data:', err);